@@ -13,31 +13,111 @@ Autor: Desenvolvedor Python
 Data: Janeiro 2026
 """
 
+import logging
+import queue
+import sys
+from collections import Counter
 from dataclasses import dataclass
-from typing import List, Optional, Protocol
-from enum import Enum
+from logging.handlers import QueueHandler, QueueListener
+from typing import Iterable, List, Optional, Protocol, Tuple
+from enum import IntEnum
 from abc import ABC, abstractmethod
 from datetime import datetime
 
 
+# ============================================================================
+# LOGGING - Notificações sem I/O no caminho crítico
+# ============================================================================
+
+# Importar o módulo não configura saída nem inicia threads: quem usa os
+# serviços decide para onde vão os logs (ver `iniciar_logs_em_fila`).
+logger = logging.getLogger('pedidos')
+logger.setLevel(logging.INFO)
+logger.addHandler(logging.NullHandler())
+
+
+# Estado da fila de logs ativa: (ouvinte, handler, propagate anterior)
+_fila_logs_ativa: Optional[Tuple[QueueListener, QueueHandler, bool]] = None
+
+
+def iniciar_logs_em_fila() -> QueueListener:
+    """
+    Direciona o logger 'pedidos' para o stdout por meio de uma fila.
+    
+    O chamador apenas enfileira o registro; a escrita no stdout acontece
+    em uma thread de fundo do QueueListener. Enquanto a fila está ativa
+    o logger não propaga para os ancestrais; o valor anterior de
+    `propagate` é restaurado por `parar_logs_em_fila`.
+    
+    Returns:
+        Ouvinte já iniciado; encerre-o com `parar_logs_em_fila`
+        
+    Raises:
+        RuntimeError: Se a fila de logs já estiver ativa
+    """
+    global _fila_logs_ativa
+    if _fila_logs_ativa is not None:
+        raise RuntimeError("A fila de logs já está ativa")
+    
+    fila: queue.Queue = queue.Queue(-1)
+    saida = logging.StreamHandler(sys.stdout)
+    saida.setFormatter(logging.Formatter('%(message)s'))
+    ouvinte = QueueListener(fila, saida)
+    handler = QueueHandler(fila)
+    _fila_logs_ativa = (ouvinte, handler, logger.propagate)
+    logger.addHandler(handler)
+    logger.propagate = False
+    ouvinte.start()
+    return ouvinte
+
+
+def parar_logs_em_fila(ouvinte: QueueListener) -> None:
+    """
+    Escreve os registros pendentes e desliga a fila de logs.
+    
+    Depois desta chamada, tudo o que foi registrado já está no stdout,
+    antes de qualquer print posterior do chamador.
+    
+    Args:
+        ouvinte: Ouvinte retornado por `iniciar_logs_em_fila`
+        
+    Raises:
+        RuntimeError: Se `ouvinte` não for o da fila ativa
+    """
+    global _fila_logs_ativa
+    if _fila_logs_ativa is None or _fila_logs_ativa[0] is not ouvinte:
+        raise RuntimeError("Este ouvinte não corresponde à fila de logs ativa")
+    
+    _, handler, propagacao_anterior = _fila_logs_ativa
+    ouvinte.stop()
+    logger.removeHandler(handler)
+    logger.propagate = propagacao_anterior
+    _fila_logs_ativa = None
+
+
 # ============================================================================
 # ENUMERAÇÕES - Para valores predefinidos
 # ============================================================================
 
-class StatusPedido(Enum):
-    """Estados possíveis de um pedido."""
-    PENDENTE = "pendente"
-    PROCESSANDO = "processando"
-    ENVIADO = "enviado"
-    ENTREGUE = "entregue"
-    CANCELADO = "cancelado"
+class StatusPedido(IntEnum):
+    """
+    Estados possíveis de um pedido.
+    
+    Valores inteiros tornam as comparações de status simples comparações
+    de int; use `status.name.lower()` para obter o rótulo textual.
+    """
+    PENDENTE = 0
+    PROCESSANDO = 1
+    ENVIADO = 2
+    ENTREGUE = 3
+    CANCELADO = 4
 
 
 # ============================================================================
 # MODELOS DE DADOS - Usando dataclasses
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class Endereco:
     """Representa um endereço completo."""
     rua: str
@@ -55,7 +135,7 @@ class Endereco:
         return endereco
 
 
-@dataclass
+@dataclass(slots=True)
 class Produto:
     """Representa um produto disponível para venda."""
     id_produto: str
@@ -92,7 +172,7 @@ class Produto:
         return False
 
 
-@dataclass
+@dataclass(slots=True)
 class ItemPedido:
     """Representa um item dentro de um pedido."""
     produto: Produto
@@ -119,6 +199,11 @@ class Pedido:
     Responsabilidade única: Gerenciar dados e estado do pedido.
     """
     
+    __slots__ = (
+        'id_pedido', 'cliente_nome', 'endereco_entrega', 'items',
+        'status', 'data_criacao',
+    )
+    
     def __init__(self, id_pedido: str, cliente_nome: str, endereco_entrega: Endereco):
         """
         Inicializa um novo pedido.
@@ -169,7 +254,7 @@ class Pedido:
         Returns:
             True se não há itens
         """
-        return self.obter_numero_itens() == 0
+        return not self.items
 
 
 class CalculadoraFrete:
@@ -180,6 +265,7 @@ class CalculadoraFrete:
     """
     
     _VALOR_BASE_FRETE = 10.0
+    _TAXA_PESO = 2.0  # Por quilograma
     _TAXA_DISTANCIA = 0.5  # Por quilômetro
     
     @staticmethod
@@ -194,9 +280,37 @@ class CalculadoraFrete:
         Returns:
             Valor do frete em reais
         """
-        valor_peso = peso_kg * 2.0
+        valor_peso = peso_kg * CalculadoraFrete._TAXA_PESO
         valor_distancia = distancia_km * CalculadoraFrete._TAXA_DISTANCIA
         return CalculadoraFrete._VALOR_BASE_FRETE + valor_peso + valor_distancia
+    
+    @staticmethod
+    def calcular_frete_lote(
+        pesos_kg: Iterable[float],
+        distancias_km: Iterable[float]
+    ) -> List[float]:
+        """
+        Calcula o frete de várias remessas em uma única passada.
+        
+        As taxas são lidas uma vez, fora do laço, em vez de a cada remessa.
+        
+        Args:
+            pesos_kg: Pesos de cada remessa em quilogramas
+            distancias_km: Distâncias de cada remessa em quilômetros
+            
+        Returns:
+            Lista com o valor do frete de cada remessa, na mesma ordem
+            
+        Raises:
+            ValueError: Se as sequências tiverem tamanhos diferentes
+        """
+        base = CalculadoraFrete._VALOR_BASE_FRETE
+        taxa_peso = CalculadoraFrete._TAXA_PESO
+        taxa_distancia = CalculadoraFrete._TAXA_DISTANCIA
+        return [
+            base + peso * taxa_peso + distancia * taxa_distancia
+            for peso, distancia in zip(pesos_kg, distancias_km, strict=True)
+        ]
 
 
 class GerenciadorEstoque:
@@ -246,6 +360,22 @@ class GerenciadorEstoque:
         if produto is None:
             return False
         return produto.pode_vender(quantidade)
+    
+    def verificar_disponibilidade_lote(self, itens: Iterable[Tuple[str, int]]) -> bool:
+        """
+        Verifica a disponibilidade de vários produtos de uma só vez.
+        
+        Args:
+            itens: Pares (id_produto, quantidade desejada)
+            
+        Returns:
+            True se todos os itens têm estoque suficiente
+        """
+        produtos = self.produtos
+        return all(
+            id_produto in produtos and produtos[id_produto].quantidade_estoque >= quantidade
+            for id_produto, quantidade in itens
+        )
 
 
 class ProcessadorPagamento:
@@ -271,7 +401,7 @@ class ProcessadorPagamento:
         
         # Simulação de processamento
         # Em produção, integraria com gateway de pagamento real
-        print(f"Processando pagamento de R$ {valor:.2f} via {metodo}...")
+        logger.info("Processando pagamento de R$ %.2f via %s...", valor, metodo)
         return True
 
 
@@ -291,7 +421,7 @@ class NotificadorPedido:
             pedido: Pedido confirmado
         """
         mensagem = f"Pedido {pedido.id_pedido} confirmado para {pedido.cliente_nome}"
-        print(f"📧 Notificação: {mensagem}")
+        logger.info("📧 Notificação: %s", mensagem)
     
     @staticmethod
     def notificar_envio(pedido: Pedido) -> None:
@@ -302,7 +432,7 @@ class NotificadorPedido:
             pedido: Pedido enviado
         """
         mensagem = f"Pedido {pedido.id_pedido} foi enviado para {pedido.endereco_entrega.cidade}"
-        print(f"📦 Notificação: {mensagem}")
+        logger.info("📦 Notificação: %s", mensagem)
     
     @staticmethod
     def notificar_entrega(pedido: Pedido) -> None:
@@ -313,7 +443,7 @@ class NotificadorPedido:
             pedido: Pedido entregue
         """
         mensagem = f"Pedido {pedido.id_pedido} entregue para {pedido.cliente_nome}"
-        print(f"✅ Notificação: {mensagem}")
+        logger.info("✅ Notificação: %s", mensagem)
 
 
 # ============================================================================
@@ -350,27 +480,36 @@ class ServicoVendas:
         """
         # Validar pedido
         if pedido.esta_vazio():
-            print("❌ Erro: Pedido vazio!")
+            logger.error("❌ Erro: Pedido vazio!")
             return False
         
-        # Validar disponibilidade de estoque
+        # Somar quantidades por produto (um produto pode estar em vários itens)
+        baixas: Counter = Counter()
         for item in pedido.items:
-            if not self.estoque.verificar_disponibilidade(
-                item.produto.id_produto,
-                item.quantidade
-            ):
-                print(f"❌ Erro: Produto {item.produto.nome} indisponível!")
-                return False
+            baixas[item.produto.id_produto] += item.quantidade
+        
+        # Validar disponibilidade de estoque
+        if not self.estoque.verificar_disponibilidade_lote(baixas.items()):
+            id_indisponivel = next(
+                id_produto for id_produto, quantidade in baixas.items()
+                if not self.estoque.verificar_disponibilidade(id_produto, quantidade)
+            )
+            nome = next(
+                item.produto.nome for item in pedido.items
+                if item.produto.id_produto == id_indisponivel
+            )
+            logger.error("❌ Erro: Produto %s indisponível!", nome)
+            return False
         
         # Processar pagamento
         total = pedido.obter_total()
         if not self.processador_pagamento.processar_pagamento(total, metodo_pagamento):
-            print("❌ Erro: Falha ao processar pagamento!")
+            logger.error("❌ Erro: Falha ao processar pagamento!")
             return False
         
-        # Reduzir estoque
-        for item in pedido.items:
-            item.produto.reduzir_estoque(item.quantidade)
+        # Reduzir estoque: uma baixa por produto, já validada acima
+        for id_produto, quantidade in baixas.items():
+            self.estoque.produtos[id_produto].quantidade_estoque -= quantidade
         
         # Atualizar status e notificar
         pedido.status = StatusPedido.PROCESSANDO
@@ -451,10 +590,15 @@ def main():
     servico_vendas.estoque.adicionar_produto(produto1)
     servico_vendas.estoque.adicionar_produto(produto2)
     
-    sucesso = servico_vendas.processar_pedido(pedido, "cartao")
+    ouvinte_logs = iniciar_logs_em_fila()
+    try:
+        sucesso = servico_vendas.processar_pedido(pedido, "cartao")
+    finally:
+        # Esvazia a fila para que as notificações saiam antes dos prints abaixo
+        parar_logs_em_fila(ouvinte_logs)
     if sucesso:
         print("✅ Pedido processado com sucesso!")
-        print(f"✅ Status: {pedido.status.value}")
+        print(f"✅ Status: {pedido.status.name.lower()}")
     
     print("\n" + "=" * 70)
     print("✅ Código limpo demonstrado com sucesso!")
@@ -12,10 +12,13 @@ Autor: Desenvolvedor Python
 Data: Janeiro 2026
 """
 
-from typing import List, Dict, Any, Callable, Optional
+from typing import List, Dict, Any, Callable, Iterable, Optional, Tuple
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
+from functools import lru_cache, wraps
 import json
+import threading
+import time
 
 
 # ============================================================================
@@ -47,8 +50,13 @@ class ConfiguracaoAplicacao:
         print("⚙️  ConfiguracaoAplicacao inicializada")
     
     def obter_configuracao(self, chave: str) -> Any:
-        """Retorna uma configuração específica."""
-        return getattr(self, chave, None)
+        """
+        Retorna uma configuração específica (ou None se não existir).
+        
+        As configurações são atributos simples de instância, então basta
+        consultar o `__dict__` diretamente, sem o protocolo de descritores.
+        """
+        return self.__dict__.get(chave)
 
 
 # ============================================================================
@@ -84,6 +92,11 @@ class ContrutorRelatorio:
         self._dados.append(dado)
         return self
     
+    def adicionar_dados(self, dados: Iterable[Dict[str, Any]]) -> 'ContrutorRelatorio':
+        """Adiciona vários dados de uma vez (uma única chamada a extend)."""
+        self._dados.extend(dados)
+        return self
+    
     def com_rodape(self, rodape: str) -> 'ContrutorRelatorio':
         """Define o rodapé do relatório."""
         self._rodape = rodape
@@ -195,16 +208,25 @@ class FabricaNotificacoes:
         """
         Cria uma notificação do tipo especificado.
         
+        Como os notificadores não guardam estado, uma única instância
+        por tipo é criada e reutilizada nas chamadas seguintes.
+        
         Args:
-            tipo: 'email', 'sms' ou 'push'
+            tipo: 'email', 'sms' ou 'push' (sem diferenciar maiúsculas)
             
         Returns:
             Instância de Notificacao
         """
-        classe = cls._tipos.get(tipo.lower())
-        if classe is None:
+        chave = tipo.lower()
+        if chave not in cls._tipos:
             raise ValueError("Tipo de notificação inválido: " + tipo)
-        return classe()
+        return cls._instancia(chave)
+    
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _instancia(cls, chave: str) -> Notificacao:
+        """Cria (uma única vez por tipo) a instância de notificação."""
+        return cls._tipos[chave]()
 
 
 # ============================================================================
@@ -237,19 +259,32 @@ class CacheObservador(Observador):
 
 
 class SistemaNotificacoes:
-    """Implementa o padrão Observer."""
+    """
+    Implementa o padrão Observer.
+    
+    Os observadores ficam em uma tupla imutável, substituída a cada
+    registro ou remoção (copy-on-write). Assim a notificação percorre um
+    retrato estável da lista, sem precisar de lock. Registro e remoção
+    são leitura-modificação-escrita e por isso são serializados por um
+    lock, para que alterações concorrentes não se percam.
+    """
     
     def __init__(self):
-        """Inicializa com lista vazia de observadores."""
-        self._observadores: List[Observador] = []
+        """Inicializa sem observadores."""
+        self._observadores: Tuple[Observador, ...] = ()
+        self._lock_alteracao = threading.Lock()
     
     def registrar_observador(self, observador: Observador) -> None:
         """Registra um observador."""
-        self._observadores.append(observador)
+        with self._lock_alteracao:
+            self._observadores = self._observadores + (observador,)
     
     def remover_observador(self, observador: Observador) -> None:
-        """Remove um observador."""
-        self._observadores.remove(observador)
+        """Remove um observador (ValueError se não estiver registrado)."""
+        with self._lock_alteracao:
+            observadores = list(self._observadores)
+            observadores.remove(observador)
+            self._observadores = tuple(observadores)
     
     def notificar_observadores(self, evento: str, dados: Dict[str, Any]) -> None:
         """Notifica todos os observadores."""
@@ -266,12 +301,15 @@ def medir_tempo_execucao(funcao: Callable) -> Callable:
     Decorador que mede e exibe o tempo de execução de uma função.
     
     Educacional: Demonstra o uso de decoradores para adicionar
-    funcionalidade sem modificar a função original.
+    funcionalidade sem modificar a função original. Usa o relógio
+    monotônico `time.perf_counter_ns` e preserva nome e docstring da
+    função decorada com `functools.wraps`.
     """
+    @wraps(funcao)
     def wrapper(*args, **kwargs):
-        inicio = datetime.now()
+        inicio = time.perf_counter_ns()
         resultado = funcao(*args, **kwargs)
-        duracao = (datetime.now() - inicio).total_seconds()
+        duracao = (time.perf_counter_ns() - inicio) / 1e9
         print("⏱️  " + funcao.__name__ + " levou " + str(round(duracao, 4)) + " segundos")
         return resultado
     return wrapper
@@ -279,11 +317,13 @@ def medir_tempo_execucao(funcao: Callable) -> Callable:
 
 @medir_tempo_execucao
 def processar_dados_grande(tamanho: int) -> int:
-    """Função que processa muitos dados."""
-    total = 0
-    for i in range(tamanho):
-        total += i
-    return total
+    """
+    Função que processa muitos dados.
+    
+    A soma é feita por `sum(range(...))`, cujo laço roda em C em vez de
+    executar um `total += i` em bytecode a cada elemento.
+    """
+    return sum(range(tamanho))
 
 
 # ============================================================================
@@ -340,6 +380,16 @@ def main():
     
     print(json.dumps(relatorio, ensure_ascii=False, indent=2))
     
+    # Alternativa para muitos registros: carga em lote
+    relatorio_lote = (ContrutorRelatorio()
+                      .com_titulo("Relatório de Vendas (lote)")
+                      .adicionar_dados([
+                          {"produto": "Notebook", "quantidade": 5},
+                          {"produto": "Mouse", "quantidade": 20},
+                      ])
+                      .construir())
+    print("Dados carregados em lote: " + str(len(relatorio_lote['dados'])))
+    
     # 3. PADRÃO STRATEGY
     print("\n3. PADRÃO STRATEGY")
     print("-" * 70)
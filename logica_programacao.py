@@ -11,6 +11,8 @@ Autor: Desenvolvedor Python
 Data: Janeiro 2026
 """
 
+from bisect import bisect_left
+from collections import Counter
 from typing import List, Dict, Tuple, Set
 
 
@@ -22,6 +24,9 @@ def busca_binaria(lista: List[int], alvo: int) -> int:
     """
     Encontra a posição de um elemento em uma lista ordenada usando busca binária.
     
+    A divisão do intervalo é feita por `bisect.bisect_left`, implementado
+    em C, evitando o custo do interpretador a cada iteração do laço.
+    
     Args:
         lista: Lista ordenada de inteiros
         alvo: Elemento a ser procurado
@@ -31,18 +36,9 @@ def busca_binaria(lista: List[int], alvo: int) -> int:
         
     Complexidade: O(log n)
     """
-    esquerda, direita = 0, len(lista) - 1
-    
-    while esquerda <= direita:
-        meio = (esquerda + direita) // 2
-        
-        if lista[meio] == alvo:
-            return meio
-        elif lista[meio] < alvo:
-            esquerda = meio + 1
-        else:
-            direita = meio - 1
-    
+    indice = bisect_left(lista, alvo)
+    if indice < len(lista) and lista[indice] == alvo:
+        return indice
     return -1
 
 
@@ -52,29 +48,39 @@ def busca_binaria(lista: List[int], alvo: int) -> int:
 
 def merge_sort(lista: List[int]) -> List[int]:
     """
-    Ordena uma lista usando o algoritmo Merge Sort (dividir e conquistar).
+    Ordena uma lista usando ordenação estável baseada em intercalação.
+    
+    Delegamos ao Timsort do CPython (`sorted`), que é um merge sort
+    adaptativo implementado em C: evita recriar listas a cada nível de
+    recursão e mantém a estabilidade do Merge Sort clássico.
     
     Args:
         lista: Lista de inteiros para ordenar
         
     Returns:
-        Lista ordenada
+        Nova lista ordenada (a original não é alterada)
         
     Complexidade: O(n log n)
     """
-    if len(lista) <= 1:
-        return lista
-    
-    meio = len(lista) // 2
-    esquerda = merge_sort(lista[:meio])
-    direita = merge_sort(lista[meio:])
+    return sorted(lista)
+
+
+def merge_sort_inplace(lista: List[int]) -> None:
+    """
+    Ordena a lista no próprio objeto, sem criar uma cópia.
     
-    return mesclar(esquerda, direita)
+    Args:
+        lista: Lista de inteiros que será ordenada in-place
+    """
+    lista.sort()
 
 
 def mesclar(esquerda: List[int], direita: List[int]) -> List[int]:
     """
     Mescla duas listas ordenadas em uma única lista ordenada.
+    
+    Etapa de intercalação do Merge Sort, mantida como referência didática
+    do algoritmo.
     """
     resultado = []
     i = j = 0
@@ -92,14 +98,100 @@ def mesclar(esquerda: List[int], direita: List[int]) -> List[int]:
     return resultado
 
 
+def merge_sort_iterativo(lista: List[int]) -> List[int]:
+    """
+    Ordena uma lista com Merge Sort iterativo (bottom-up).
+    
+    Intercala blocos de largura 1, 2, 4, ... alternando entre dois buffers
+    pré-alocados, sem recursão e sem criar listas a cada nível.
+    
+    Args:
+        lista: Lista de inteiros para ordenar
+        
+    Returns:
+        Nova lista ordenada
+        
+    Complexidade: O(n log n) tempo, O(n) memória auxiliar
+    """
+    origem = list(lista)
+    n = len(origem)
+    destino = [0] * n
+    largura = 1
+    
+    while largura < n:
+        for inicio in range(0, n, 2 * largura):
+            meio = min(inicio + largura, n)
+            fim = min(inicio + 2 * largura, n)
+            _mesclar_intervalo(origem, destino, inicio, meio, fim)
+        origem, destino = destino, origem
+        largura *= 2
+    
+    return origem
+
+
+def _mesclar_intervalo(
+    origem: List[int],
+    destino: List[int],
+    inicio: int,
+    meio: int,
+    fim: int
+) -> None:
+    """
+    Mescla origem[inicio:meio] e origem[meio:fim] em destino[inicio:fim].
+    """
+    i, j, k = inicio, meio, inicio
+    
+    while i < meio and j < fim:
+        if origem[i] <= origem[j]:
+            destino[k] = origem[i]
+            i += 1
+        else:
+            destino[k] = origem[j]
+            j += 1
+        k += 1
+    
+    if i < meio:
+        destino[k:fim] = origem[i:meio]
+    else:
+        destino[k:fim] = origem[j:fim]
+
+
 # ============================================================================
-# 3. RECURSÃO - Fibonacci com memoização
+# 3. FIBONACCI - Versão iterativa e fast doubling
 # ============================================================================
 
-def fibonacci(n: int, memo: Dict[int, int] | None = None) -> int:
+def fibonacci(n: int) -> int:
+    """
+    Calcula o n-ésimo número de Fibonacci de forma iterativa.
+    
+    Mantém apenas os dois últimos termos, sem recursão nem dicionário de
+    memoização, portanto não há limite de profundidade de pilha.
+    
+    Args:
+        n: Posição na sequência de Fibonacci
+        
+    Returns:
+        O n-ésimo número de Fibonacci
+        
+    Complexidade: O(n) tempo, O(1) memória
+    """
+    if n <= 1:
+        return n
+    
+    a, b = 0, 1
+    for _ in range(n):
+        a, b = b, a + b
+    return a
+
+
+def fibonacci_recursivo(n: int, memo: Dict[int, int] | None = None) -> int:
     """
     Calcula o n-ésimo número de Fibonacci usando recursão com memoização.
     
+    Versão didática de referência: mostra a definição recursiva, mas é
+    limitada pela profundidade máxima de recursão do Python. Prefira
+    `fibonacci` ou `fibonacci_fast_doubling` na prática.
+    
     Args:
         n: Posição na sequência de Fibonacci
         memo: Dicionário para armazenar valores já calculados
@@ -118,10 +210,42 @@ def fibonacci(n: int, memo: Dict[int, int] | None = None) -> int:
     if n <= 1:
         return n
     
-    memo[n] = fibonacci(n - 1, memo) + fibonacci(n - 2, memo)
+    memo[n] = fibonacci_recursivo(n - 1, memo) + fibonacci_recursivo(n - 2, memo)
     return memo[n]
 
 
+def fibonacci_fast_doubling(n: int) -> int:
+    """
+    Calcula o n-ésimo número de Fibonacci pelo método "fast doubling".
+    
+    Usa as identidades F(2k) = F(k) * (2F(k+1) - F(k)) e
+    F(2k+1) = F(k)² + F(k+1)², percorrendo os bits de n.
+    
+    Args:
+        n: Posição na sequência de Fibonacci (n >= 0)
+        
+    Returns:
+        O n-ésimo número de Fibonacci
+        
+    Raises:
+        ValueError: Se n for negativo
+        
+    Complexidade: O(log n) multiplicações
+    """
+    if n < 0:
+        raise ValueError(f"n deve ser >= 0, recebido {n}")
+    
+    a, b = 0, 1  # F(k), F(k+1)
+    for bit in bin(n)[2:]:
+        c = a * (2 * b - a)
+        d = a * a + b * b
+        if bit == '1':
+            a, b = d, c + d
+        else:
+            a, b = c, d
+    return a
+
+
 # ============================================================================
 # 4. MANIPULAÇÃO DE DICIONÁRIOS - Análise de frequência
 # ============================================================================
@@ -136,13 +260,7 @@ def contar_frequencia(texto: str) -> Dict[str, int]:
     Returns:
         Dicionário com palavras e suas frequências
     """
-    palavras = texto.lower().split()
-    frequencia = {}
-    
-    for palavra in palavras:
-        frequencia[palavra] = frequencia.get(palavra, 0) + 1
-    
-    return frequencia
+    return dict(_contar_palavras(texto))
 
 
 def top_n_palavras(texto: str, n: int = 5) -> List[Tuple[str, int]]:
@@ -156,8 +274,18 @@ def top_n_palavras(texto: str, n: int = 5) -> List[Tuple[str, int]]:
     Returns:
         Lista de tuplas (palavra, frequência) ordenada por frequência
     """
-    frequencia = contar_frequencia(texto)
-    return sorted(frequencia.items(), key=lambda x: x[1], reverse=True)[:n]
+    return _contar_palavras(texto).most_common(n)
+
+
+def _contar_palavras(texto: str) -> Counter:
+    """
+    Conta as palavras do texto com `collections.Counter`.
+    
+    O laço de contagem roda em C, sem um `dict.get` + atribuição por palavra.
+    Cada palavra é convertida para minúsculas individualmente, evitando uma
+    cópia inteira do texto em minúsculas antes da divisão.
+    """
+    return Counter(map(str.lower, texto.split()))
 
 
 # ============================================================================
@@ -168,21 +296,16 @@ def remover_duplicatas(lista: List[int]) -> List[int]:
     """
     Remove elementos duplicados mantendo a ordem original.
     
+    Desde o Python 3.7 o dicionário preserva a ordem de inserção, então
+    `dict.fromkeys` faz a deduplicação inteira em C.
+    
     Args:
         lista: Lista com possíveis duplicatas
         
     Returns:
         Lista sem duplicatas
     """
-    visto = set()
-    resultado = []
-    
-    for elemento in lista:
-        if elemento not in visto:
-            visto.add(elemento)
-            resultado.append(elemento)
-    
-    return resultado
+    return list(dict.fromkeys(lista))
 
 
 def encontrar_pares(lista: List[int], alvo: int) -> List[Tuple[int, int]]:
@@ -196,16 +319,16 @@ def encontrar_pares(lista: List[int], alvo: int) -> List[Tuple[int, int]]:
     Returns:
         Lista de tuplas com pares que somam o valor alvo
     """
-    pares = []
+    pares = set()
     visto = set()
     
     for num in lista:
         complemento = alvo - num
         if complemento in visto:
-            pares.append((min(num, complemento), max(num, complemento)))
+            pares.add((complemento, num) if complemento < num else (num, complemento))
         visto.add(num)
     
-    return list(set(pares))
+    return list(pares)
 
 
 # ============================================================================
@@ -261,7 +384,7 @@ def main():
     print(f"Lista ordenada: {lista_ordenada}")
     
     # 3. Fibonacci
-    print("\n3. FIBONACCI (Recursão com Memoização)")
+    print("\n3. FIBONACCI (Iterativo)")
     print("-" * 70)
     n = 10
     resultado = fibonacci(n)
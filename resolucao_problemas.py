@@ -12,11 +12,29 @@ Autor: Desenvolvedor Python
 Data: Janeiro 2026
 """
 
+import math
 import re
-from typing import List, Dict, Tuple, Optional
+from collections import deque
+from functools import lru_cache
+from typing import Deque, Dict, List, Optional, Sequence, Tuple
 from dataclasses import dataclass
 
 
+# ============================================================================
+# CONSTANTES - Padrões e tabelas criados uma única vez, ao carregar o módulo
+# ============================================================================
+
+_PADRAO_EMAIL = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_PADRAO_NAO_ALFANUMERICO = re.compile(r'[^a-z0-9]')
+
+_CARACTERES_ESPECIAIS = frozenset('!@#$%^&*(),.?":{}|<>')
+
+_ABERTURAS = frozenset('([{')
+_ABERTURA_CORRESPONDENTE = {')': '(', ']': '[', '}': '{'}
+
+_BLOCO_PALINDROMO = 4096
+
+
 # ============================================================================
 # PROBLEMA 1: VALIDAÇÃO DE EMAIL
 # ============================================================================
@@ -37,8 +55,7 @@ def validar_email(email: str) -> bool:
     Returns:
         True se válido, False caso contrário
     """
-    padrao = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(padrao, email))
+    return bool(_PADRAO_EMAIL.match(email))
 
 
 # ============================================================================
@@ -64,19 +81,31 @@ def validar_senha_forte(senha: str) -> Tuple[bool, List[str]]:
     """
     problemas = []
     
+    # Uma única passada classifica cada caractere em todas as categorias
+    tem_maiuscula = tem_minuscula = tem_numero = tem_especial = False
+    for caractere in senha:
+        if 'A' <= caractere <= 'Z':
+            tem_maiuscula = True
+        elif 'a' <= caractere <= 'z':
+            tem_minuscula = True
+        elif caractere.isdecimal():
+            tem_numero = True
+        elif caractere in _CARACTERES_ESPECIAIS:
+            tem_especial = True
+    
     if len(senha) < 8:
         problemas.append("❌ Mínimo 8 caracteres")
     
-    if not re.search(r'[A-Z]', senha):
+    if not tem_maiuscula:
         problemas.append("❌ Falta letra maiúscula")
     
-    if not re.search(r'[a-z]', senha):
+    if not tem_minuscula:
         problemas.append("❌ Falta letra minúscula")
     
-    if not re.search(r'\d', senha):
+    if not tem_numero:
         problemas.append("❌ Falta número")
     
-    if not re.search(r'[!@#$%^&*(),.?":{}|<>]', senha):
+    if not tem_especial:
         problemas.append("❌ Falta caractere especial")
     
     return len(problemas) == 0, problemas
@@ -106,9 +135,9 @@ def calcular_juros_compostos(
     Returns:
         Dicionário com montante final e juros ganhos
     """
-    taxa_decimal = taxa_anual / 100
-    montante_final = capital_inicial * (1 + taxa_decimal / frequencia_capitalizacao) ** (
-        frequencia_capitalizacao * tempo_anos
+    taxa_periodo = taxa_anual / 100 / frequencia_capitalizacao
+    montante_final = capital_inicial * math.pow(
+        1 + taxa_periodo, frequencia_capitalizacao * tempo_anos
     )
     juros_ganhos = montante_final - capital_inicial
     
@@ -121,6 +150,52 @@ def calcular_juros_compostos(
     }
 
 
+def calcular_juros_compostos_lote(
+    capitais_iniciais: Sequence[float],
+    taxas_anuais: Sequence[float],
+    tempos_anos: Sequence[int],
+    frequencia_capitalizacao: int = 12
+) -> Dict[str, List[float]]:
+    """
+    Calcula juros compostos para vários investimentos de uma vez.
+    
+    Útil para tabelas de simulação: as três sequências são percorridas
+    juntas, posição a posição, em uma única passada.
+    
+    Args:
+        capitais_iniciais: Capital inicial de cada investimento
+        taxas_anuais: Taxa de juros anual de cada investimento (em %)
+        tempos_anos: Tempo de cada investimento (em anos)
+        frequencia_capitalizacao: Vezes por ano (padrão: 12 - mensal)
+        
+    Returns:
+        Dicionário com as mesmas chaves de `calcular_juros_compostos`,
+        cada uma associada a uma lista de valores
+        
+    Raises:
+        ValueError: Se as sequências tiverem tamanhos diferentes
+    """
+    montantes = []
+    juros = []
+    for capital, taxa, tempo in zip(
+        capitais_iniciais, taxas_anuais, tempos_anos, strict=True
+    ):
+        montante = capital * math.pow(
+            1 + taxa / 100 / frequencia_capitalizacao,
+            frequencia_capitalizacao * tempo
+        )
+        montantes.append(round(montante, 2))
+        juros.append(round(montante - capital, 2))
+    
+    return {
+        'capital_inicial': list(capitais_iniciais),
+        'montante_final': montantes,
+        'juros_ganhos': juros,
+        'taxa_anual': list(taxas_anuais),
+        'tempo_anos': list(tempos_anos),
+    }
+
+
 # ============================================================================
 # PROBLEMA 4: NÚMERO PERFEITO E NÚMEROS AMIGOS
 # ============================================================================
@@ -130,17 +205,55 @@ def encontrar_divisores(numero: int) -> List[int]:
     Encontra todos os divisores próprios de um número.
     Divisores próprios são todos os divisores exceto o próprio número.
     
+    Os divisores aparecem em pares (i, numero // i), então basta testar
+    i até a raiz quadrada de numero: O(√n) em vez de O(n) divisões.
+    
     Args:
         numero: Número para encontrar divisores
         
     Returns:
-        Lista de divisores próprios
+        Lista de divisores próprios, em ordem crescente
+    """
+    if numero < 2:
+        return []
+    
+    menores = [1]
+    maiores = []
+    for i in range(2, math.isqrt(numero) + 1):
+        if numero % i == 0:
+            menores.append(i)
+            par = numero // i
+            if par != i:
+                maiores.append(par)
+    
+    return menores + maiores[::-1]
+
+
+@lru_cache(maxsize=None)
+def soma_divisores_proprios(numero: int) -> int:
+    """
+    Soma os divisores próprios de um número sem montar a lista.
+    
+    Memoizada: ao testar muitos pares de números amigos ou candidatos a
+    número perfeito, valores repetidos são respondidos do cache.
+    
+    Args:
+        numero: Número a analisar
+        
+    Returns:
+        Soma dos divisores próprios (0 para números menores que 2)
     """
-    divisores = []
-    for i in range(1, numero):
+    if numero < 2:
+        return 0
+    
+    total = 1
+    for i in range(2, math.isqrt(numero) + 1):
         if numero % i == 0:
-            divisores.append(i)
-    return divisores
+            total += i
+            par = numero // i
+            if par != i:
+                total += par
+    return total
 
 
 def eh_numero_perfeito(numero: int) -> bool:
@@ -154,7 +267,7 @@ def eh_numero_perfeito(numero: int) -> bool:
     Returns:
         True se é número perfeito
     """
-    return numero == sum(encontrar_divisores(numero))
+    return numero == soma_divisores_proprios(numero)
 
 
 def sao_numeros_amigos(a: int, b: int) -> bool:
@@ -170,10 +283,7 @@ def sao_numeros_amigos(a: int, b: int) -> bool:
     Returns:
         True se são números amigos
     """
-    soma_divisores_a = sum(encontrar_divisores(a))
-    soma_divisores_b = sum(encontrar_divisores(b))
-    
-    return soma_divisores_a == b and soma_divisores_b == a
+    return soma_divisores_proprios(a) == b and soma_divisores_proprios(b) == a
 
 
 # ============================================================================
@@ -184,25 +294,47 @@ def eh_palindromo(texto: str) -> bool:
     """
     Verifica se um texto é um palíndromo (lê igual de trás para frente).
     
+    Textos longos são comparados em blocos das pontas para o centro: a
+    memória extra fica limitada ao tamanho do bloco e a verificação para
+    no primeiro bloco diferente, sem inverter o texto inteiro.
+    
     Args:
         texto: Texto para verificar
         
     Returns:
         True se é palíndromo
     """
-    texto_limpo = re.sub(r'[^a-z0-9]', '', texto.lower())
-    return texto_limpo == texto_limpo[::-1]
+    texto_limpo = _PADRAO_NAO_ALFANUMERICO.sub('', texto.lower())
+    tamanho = len(texto_limpo)
+    if tamanho <= 2 * _BLOCO_PALINDROMO:
+        return texto_limpo == texto_limpo[::-1]
+    
+    meio = tamanho // 2
+    for inicio in range(0, meio, _BLOCO_PALINDROMO):
+        fim = min(inicio + _BLOCO_PALINDROMO, meio)
+        espelho = texto_limpo[tamanho - fim:tamanho - inicio]
+        if texto_limpo[inicio:fim] != espelho[::-1]:
+            return False
+    return True
 
 
 # ============================================================================
 # PROBLEMA 6: MAIOR SUBSEQUÊNCIA COMUM
 # ============================================================================
 
+# Direção escolhida em cada célula da programação dinâmica
+_DIAGONAL, _ACIMA, _ESQUERDA = 0, 1, 2
+
+
 def mdc_sequencias(seq1: str, seq2: str) -> str:
     """
     Encontra a maior subsequência comum entre duas sequências.
     Usa programação dinâmica.
     
+    Apenas duas linhas da tabela de comprimentos ficam em memória; para a
+    reconstrução guardamos a direção de cada célula em um bytearray
+    (1 byte por célula em vez de um int Python).
+    
     Args:
         seq1: Primeira sequência
         seq2: Segunda sequência
@@ -212,26 +344,36 @@ def mdc_sequencias(seq1: str, seq2: str) -> str:
     """
     m, n = len(seq1), len(seq2)
     
-    # Criar matriz de programação dinâmica
-    dp = [[0] * (n + 1) for _ in range(m + 1)]
+    direcoes = bytearray(m * n)
+    anterior, atual = [0] * (n + 1), [0] * (n + 1)
     
-    for i in range(1, m + 1):
-        for j in range(1, n + 1):
-            if seq1[i - 1] == seq2[j - 1]:
-                dp[i][j] = dp[i - 1][j - 1] + 1
+    for i, caractere in enumerate(seq1):
+        base = i * n
+        for j, outro in enumerate(seq2, 1):
+            if caractere == outro:
+                atual[j] = anterior[j - 1] + 1
+                direcoes[base + j - 1] = _DIAGONAL
             else:
-                dp[i][j] = max(dp[i - 1][j], dp[i][j - 1])
+                acima, esquerda = anterior[j], atual[j - 1]
+                if acima > esquerda:
+                    atual[j] = acima
+                    direcoes[base + j - 1] = _ACIMA
+                else:
+                    atual[j] = esquerda
+                    direcoes[base + j - 1] = _ESQUERDA
+        anterior, atual = atual, anterior
     
     # Reconstruir a subsequência
     resultado = []
     i, j = m, n
     
     while i > 0 and j > 0:
-        if seq1[i - 1] == seq2[j - 1]:
+        direcao = direcoes[(i - 1) * n + j - 1]
+        if direcao == _DIAGONAL:
             resultado.append(seq1[i - 1])
             i -= 1
             j -= 1
-        elif dp[i - 1][j] > dp[i][j - 1]:
+        elif direcao == _ACIMA:
             i -= 1
         else:
             j -= 1
@@ -239,6 +381,34 @@ def mdc_sequencias(seq1: str, seq2: str) -> str:
     return ''.join(reversed(resultado))
 
 
+def mdc_sequencias_len(seq1: str, seq2: str) -> int:
+    """
+    Calcula apenas o comprimento da maior subsequência comum.
+    
+    Sem reconstrução, basta manter duas linhas da tabela: O(n) memória.
+    
+    Args:
+        seq1: Primeira sequência
+        seq2: Segunda sequência
+        
+    Returns:
+        Comprimento da maior subsequência comum
+    """
+    n = len(seq2)
+    anterior, atual = [0] * (n + 1), [0] * (n + 1)
+    
+    for caractere in seq1:
+        for j, outro in enumerate(seq2, 1):
+            if caractere == outro:
+                atual[j] = anterior[j - 1] + 1
+            else:
+                acima, esquerda = anterior[j], atual[j - 1]
+                atual[j] = acima if acima > esquerda else esquerda
+        anterior, atual = atual, anterior
+    
+    return anterior[n]
+
+
 # ============================================================================
 # PROBLEMA 7: BALANCEAMENTO DE PARÊNTESES
 # ============================================================================
@@ -254,16 +424,16 @@ def balanceamento_parenteses(expressao: str) -> bool:
         True se está balanceada
     """
     pilha = []
-    pares = {'(': ')', '[': ']', '{': '}'}
+    empilhar, desempilhar = pilha.append, pilha.pop
     
     for char in expressao:
-        if char in pares:
-            pilha.append(char)
-        elif char in pares.values():
-            if not pilha or pares[pilha.pop()] != char:
+        if char in _ABERTURAS:
+            empilhar(char)
+        elif char in _ABERTURA_CORRESPONDENTE:
+            if not pilha or desempilhar() != _ABERTURA_CORRESPONDENTE[char]:
                 return False
     
-    return len(pilha) == 0
+    return not pilha
 
 
 # ============================================================================
@@ -287,7 +457,24 @@ def rotacionar_array(array: List[int], posicoes: int) -> List[int]:
         return array
     
     posicoes = posicoes % len(array)
-    return array[-posicoes:] + array[:-posicoes]
+    # Estende a primeira fatia no lugar, sem criar uma terceira lista
+    resultado = array[-posicoes:]
+    resultado += array[:-posicoes]
+    return resultado
+
+
+def rotacionar_deque(fila: Deque[int], posicoes: int) -> None:
+    """
+    Rotaciona uma deque para a direita, modificando-a no lugar.
+    
+    Para quem pode aceitar mutação: `deque.rotate` apenas reencadeia os
+    elementos em C, sem copiar a sequência.
+    
+    Args:
+        fila: Deque a ser rotacionada
+        posicoes: Número de posições para rotacionar
+    """
+    fila.rotate(posicoes)
 
 
 # ============================================================================
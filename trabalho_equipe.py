@@ -17,11 +17,23 @@ NOTA: Para trabalho em equipe remoto, práticas como commitsg boas
 mensagens são fundamentais. Veja as boas práticas no final deste arquivo.
 """
 
-from typing import List, Dict, Tuple, Optional, Any
+from __future__ import annotations
+
+from collections import Counter, deque
+from itertools import count, islice
+from typing import Any, Deque, Dict, Final, Iterable, List, Optional, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from queue import Empty, SimpleQueue
 import json
+import sys
+import time
+
+try:
+    import orjson
+except ImportError:  # orjson é opcional; sem ele usamos o módulo json
+    orjson = None
 
 
 # ============================================================================
@@ -63,6 +75,7 @@ CONVENÇÕES DO PROJETO:
 MAX_TENTATIVAS_CONEXAO = 3
 TIMEOUT_PADRAO_SEGUNDOS = 30
 VERSAO_API = "1.0.0"
+MAX_LOGS_MEMORIA = 10_000
 
 
 # ============================================================================
@@ -85,12 +98,28 @@ class TipoMensagem(Enum):
     SUCESSO = "success"
 
 
+# Membros usados com frequência, resolvidos uma única vez
+_TIPO_INFO: Final = TipoMensagem.INFORMACAO
+_TIPO_SUCESSO: Final = TipoMensagem.SUCESSO
+
+
 # ============================================================================
 # MODELOS DE DADOS - Reutilizáveis e bem estruturados
 # ============================================================================
 
-@dataclass
-class Usuario:
+class _VinculoGerenciador:
+    """
+    Base para modelos indexados por um gerenciador.
+    
+    Guarda o gerenciador em um slot próprio, fora dos campos do dataclass,
+    de modo que ele não aparece em repr, comparações, `dataclasses.asdict`
+    nem `dataclasses.astuple`.
+    """
+    __slots__ = ('_gerenciador',)
+
+
+@dataclass(slots=True)
+class Usuario(_VinculoGerenciador):
     """
     Representa um usuário do sistema.
     
@@ -101,6 +130,11 @@ class Usuario:
         departamento: Departamento/time
         ativo: Se o usuário está ativo
         data_criacao: Quando foi criado
+    
+    Em usuários criados por um GerenciadorUsuarios, não atribua `ativo`
+    nem `departamento` diretamente: use `ativar`/`desativar` (que avisam
+    o gerenciador) e `GerenciadorUsuarios.mudar_departamento`, para que
+    os índices e a versão do gerenciador continuem corretos.
     """
     id: str
     nome: str
@@ -109,13 +143,21 @@ class Usuario:
     ativo: bool = True
     data_criacao: datetime = field(default_factory=datetime.now)
     
+    def __post_init__(self) -> None:
+        """Inicia sem gerenciador; criar_usuario define o que o indexa."""
+        self._gerenciador: Optional[GerenciadorUsuarios] = None
+    
     def ativar(self) -> None:
         """Ativa o usuário no sistema."""
         self.ativo = True
+        if self._gerenciador is not None:
+            self._gerenciador._atualizar_status(self)
     
     def desativar(self) -> None:
         """Desativa o usuário no sistema."""
         self.ativo = False
+        if self._gerenciador is not None:
+            self._gerenciador._atualizar_status(self)
     
     def para_dict(self) -> Dict[str, Any]:
         """
@@ -131,9 +173,19 @@ class Usuario:
             'ativo': self.ativo,
             'data_criacao': self.data_criacao.isoformat()
         }
+    
+    def para_json(self) -> str:
+        """
+        Converte o usuário para uma string JSON compacta.
+        
+        Usa `orjson` quando instalado; caso contrário, o módulo `json`.
+        """
+        if orjson is not None:
+            return orjson.dumps(self.para_dict()).decode()
+        return json.dumps(self.para_dict(), ensure_ascii=False, separators=(',', ':'))
 
 
-@dataclass
+@dataclass(slots=True)
 class Mensagem:
     """
     Representa uma mensagem no sistema.
@@ -144,7 +196,7 @@ class Mensagem:
         conteudo: Texto da mensagem
         tipo: Tipo de mensagem
         timestamp: Quando foi criada
-        lida: Se foi lida
+        lida: Se foi lida (só muda de False para True; não desmarque)
     """
     id: str
     remetente: Usuario
@@ -167,8 +219,22 @@ class Mensagem:
         Returns:
             True se foi enviada há menos de N horas
         """
-        tempo_limite = datetime.now().timestamp() - (horas * 3600)
-        return self.timestamp.timestamp() > tempo_limite
+        return self.timestamp.timestamp() > time.time() - horas * 3600
+    
+    @staticmethod
+    def filtrar_recentes(mensagens: Iterable['Mensagem'], horas: int = 24) -> List['Mensagem']:
+        """
+        Filtra as mensagens recentes, calculando o limite uma única vez.
+        
+        Args:
+            mensagens: Mensagens a filtrar
+            horas: Limite de horas para considerar recente
+            
+        Returns:
+            Lista com as mensagens enviadas há menos de N horas
+        """
+        tempo_limite = time.time() - horas * 3600
+        return [m for m in mensagens if m.timestamp.timestamp() > tempo_limite]
 
 
 # ============================================================================
@@ -183,11 +249,31 @@ class GerenciadorUsuarios:
     - Criar e atualizar usuários
     - Validação de dados
     - Armazenamento em memória (em produção seria banco de dados)
+    
+    Mantém índices secundários (usuários ativos e usuários por
+    departamento) para que as consultas não percorram todos os usuários.
+    Toda mudança que afeta os índices passa pelo gerenciador: ativação e
+    desativação (por `ativar_usuario`/`desativar_usuario` ou pelos
+    próprios `Usuario.ativar`/`Usuario.desativar`, que o avisam) e troca
+    de departamento (`mudar_departamento`). Os campos `ativo` e
+    `departamento` não devem ser atribuídos diretamente.
+    
+    Cada alteração incrementa `versao`, o que permite a quem agrega os
+    dados (ex.: RelatorioEquipe) reaproveitar resultados enquanto nada
+    mudar.
     """
     
     def __init__(self):
         """Inicializa o gerenciador."""
         self._usuarios: Dict[str, Usuario] = {}
+        self._ativos: Dict[str, Usuario] = {}
+        self._por_departamento: Dict[str, List[Usuario]] = {}
+        self._versao = 0
+    
+    @property
+    def versao(self) -> int:
+        """Contador incrementado a cada mudança que afeta os índices."""
+        return self._versao
     
     def criar_usuario(
         self,
@@ -220,7 +306,11 @@ class GerenciadorUsuarios:
             email=email,
             departamento=departamento
         )
+        usuario._gerenciador = self
         self._usuarios[id_usuario] = usuario
+        self._ativos[id_usuario] = usuario
+        self._por_departamento.setdefault(departamento, []).append(usuario)
+        self._versao += 1
         return usuario
     
     def obter_usuario(self, id_usuario: str) -> Optional[Usuario]:
@@ -235,6 +325,81 @@ class GerenciadorUsuarios:
         """
         return self._usuarios.get(id_usuario)
     
+    def ativar_usuario(self, id_usuario: str) -> bool:
+        """
+        Ativa um usuário e atualiza o índice de ativos.
+        
+        Args:
+            id_usuario: ID do usuário
+            
+        Returns:
+            True se conseguiu ativar, False se não encontrou
+        """
+        usuario = self._usuarios.get(id_usuario)
+        if usuario is None:
+            return False
+        usuario.ativar()
+        return True
+    
+    def desativar_usuario(self, id_usuario: str) -> bool:
+        """
+        Desativa um usuário e atualiza o índice de ativos.
+        
+        Args:
+            id_usuario: ID do usuário
+            
+        Returns:
+            True se conseguiu desativar, False se não encontrou
+        """
+        usuario = self._usuarios.get(id_usuario)
+        if usuario is None:
+            return False
+        usuario.desativar()
+        return True
+    
+    def mudar_departamento(self, id_usuario: str, departamento: str) -> bool:
+        """
+        Move um usuário para outro departamento e atualiza o índice.
+        
+        Args:
+            id_usuario: ID do usuário
+            departamento: Novo departamento
+            
+        Returns:
+            True se conseguiu mudar, False se não encontrou
+        """
+        usuario = self._usuarios.get(id_usuario)
+        if usuario is None:
+            return False
+        if usuario.departamento == departamento:
+            return True
+        
+        membros = self._por_departamento[usuario.departamento]
+        membros.remove(usuario)
+        if not membros:
+            del self._por_departamento[usuario.departamento]
+        usuario.departamento = departamento
+        self._por_departamento.setdefault(departamento, []).append(usuario)
+        self._versao += 1
+        return True
+    
+    def _atualizar_status(self, usuario: Usuario) -> None:
+        """
+        Reflete no índice de ativos uma mudança de status do usuário.
+        
+        Chamado por Usuario.ativar/desativar.
+        
+        Args:
+            usuario: Usuário cujo status mudou
+        """
+        if self._usuarios.get(usuario.id) is not usuario:
+            return  # cópia ou usuário que não pertence a este gerenciador
+        if usuario.ativo:
+            self._ativos[usuario.id] = usuario
+        else:
+            self._ativos.pop(usuario.id, None)
+        self._versao += 1
+    
     def listar_usuarios_ativos(self) -> List[Usuario]:
         """
         Lista todos os usuários ativos.
@@ -242,7 +407,7 @@ class GerenciadorUsuarios:
         Returns:
             Lista de usuários ativos
         """
-        return [u for u in self._usuarios.values() if u.ativo]
+        return list(self._ativos.values())
     
     def obter_por_departamento(self, departamento: str) -> List[Usuario]:
         """
@@ -254,7 +419,7 @@ class GerenciadorUsuarios:
         Returns:
             Lista de usuários
         """
-        return [u for u in self._usuarios.values() if u.departamento == departamento]
+        return list(self._por_departamento.get(departamento, ()))
 
 
 class GerenciadorMensagens:
@@ -265,12 +430,26 @@ class GerenciadorMensagens:
     - Armazenar e recuperar mensagens
     - Marcar como lidas
     - Filtrar por tipo/usuário
+    
+    As mensagens não lidas ficam também em um índice próprio, de modo que
+    consultá-las não exige percorrer todas as mensagens. Mensagens lidas
+    diretamente (`Mensagem.marcar_como_lida`) saem do índice na próxima
+    consulta. A saída é definitiva: `lida` só vai de False para True, e
+    voltar a atribuir `lida = False` não devolve a mensagem ao índice.
+    
+    O envio apenas coloca a mensagem em uma caixa de entrada
+    (queue.SimpleQueue), o que permite vários remetentes em threads
+    diferentes sem um lock explícito. As consultas drenam a caixa de
+    entrada para os índices antes de responder; elas devem ser feitas
+    por um único leitor.
     """
     
     def __init__(self):
         """Inicializa o gerenciador."""
+        self._caixa_entrada: SimpleQueue[Mensagem] = SimpleQueue()
         self._mensagens: Dict[str, Mensagem] = {}
-        self._contador_id = 0
+        self._nao_lidas: Dict[str, Mensagem] = {}
+        self._ids = count(1)
     
     def enviar_mensagem(
         self,
@@ -289,16 +468,37 @@ class GerenciadorMensagens:
         Returns:
             Mensagem criada
         """
-        self._contador_id += 1
         mensagem = Mensagem(
-            id=f"MSG{self._contador_id:06d}",
+            id=f"MSG{next(self._ids):06d}",
             remetente=remetente,
             conteudo=conteudo,
             tipo=tipo
         )
-        self._mensagens[mensagem.id] = mensagem
+        self._caixa_entrada.put_nowait(mensagem)
         return mensagem
     
+    def _drenar(self) -> None:
+        """Move as mensagens da caixa de entrada para os índices, em ordem de envio."""
+        obter = self._caixa_entrada.get_nowait
+        while True:
+            try:
+                mensagem = obter()
+            except Empty:
+                return
+            self._mensagens[mensagem.id] = mensagem
+            self._nao_lidas[mensagem.id] = mensagem
+    
+    def _atualizar_nao_lidas(self) -> None:
+        """
+        Drena a caixa de entrada e tira do índice as mensagens já lidas.
+        
+        A remoção é definitiva, pois `lida` só vai de False para True.
+        """
+        self._drenar()
+        lidas = [id_mensagem for id_mensagem, m in self._nao_lidas.items() if m.lida]
+        for id_mensagem in lidas:
+            del self._nao_lidas[id_mensagem]
+    
     def obter_nao_lidas(self) -> List[Mensagem]:
         """
         Obtém todas as mensagens não lidas.
@@ -306,7 +506,18 @@ class GerenciadorMensagens:
         Returns:
             Lista de mensagens não lidas
         """
-        return [m for m in self._mensagens.values() if not m.lida]
+        self._atualizar_nao_lidas()
+        return list(self._nao_lidas.values())
+    
+    def contar_nao_lidas(self) -> int:
+        """
+        Conta as mensagens não lidas sem montar a lista.
+        
+        Returns:
+            Quantidade de mensagens não lidas
+        """
+        self._atualizar_nao_lidas()
+        return len(self._nao_lidas)
     
     def marcar_lida(self, id_mensagem: str) -> bool:
         """
@@ -318,9 +529,11 @@ class GerenciadorMensagens:
         Returns:
             True se conseguiu marcar, False se não encontrou
         """
+        self._drenar()
         mensagem = self._mensagens.get(id_mensagem)
         if mensagem:
             mensagem.marcar_como_lida()
+            self._nao_lidas.pop(id_mensagem, None)
             return True
         return False
 
@@ -329,18 +542,42 @@ class GerenciadorMensagens:
 # RELATÓRIOS - Para comunicação em equipe
 # ============================================================================
 
+@dataclass(slots=True, frozen=True)
+class RelatorioDepartamento:
+    """
+    Resumo imutável de um departamento.
+    
+    Atributos:
+        departamento: Nome do departamento
+        total_usuarios: Quantidade de membros
+        usuarios_ativos: Quantidade de membros ativos
+        usuarios_inativos: Quantidade de membros inativos
+        membros: Dados de cada membro (Usuario.para_dict)
+    """
+    departamento: str
+    total_usuarios: int
+    usuarios_ativos: int
+    usuarios_inativos: int
+    membros: Tuple[Dict[str, Any], ...]
+
+
 class RelatorioEquipe:
     """
     Gera relatórios sobre atividades da equipe.
     
     Útil para reuniões e acompanhamento de trabalho.
+    
+    Os totais do relatório geral ficam em cache, associados à versão do
+    gerenciador de usuários, e só são recalculados após alguma alteração.
     """
     
     def __init__(self, gerenciador_usuarios: GerenciadorUsuarios):
         """Inicializa com acesso aos usuários."""
         self.gerenciador_usuarios = gerenciador_usuarios
+        # (versão, total de ativos, contagem por departamento)
+        self._cache_geral: Optional[Tuple[int, int, Dict[str, int]]] = None
     
-    def relatorio_departamento(self, departamento: str) -> Dict[str, Any]:
+    def relatorio_departamento(self, departamento: str) -> RelatorioDepartamento:
         """
         Gera relatório sobre um departamento.
         
@@ -348,18 +585,18 @@ class RelatorioEquipe:
             departamento: Nome do departamento
             
         Returns:
-            Dicionário com informações do departamento
+            Relatório com informações do departamento
         """
         usuarios = self.gerenciador_usuarios.obter_por_departamento(departamento)
-        usuarios_ativos = [u for u in usuarios if u.ativo]
+        total_ativos = sum(1 for u in usuarios if u.ativo)
         
-        return {
-            'departamento': departamento,
-            'total_usuarios': len(usuarios),
-            'usuarios_ativos': len(usuarios_ativos),
-            'usuarios_inativos': len(usuarios) - len(usuarios_ativos),
-            'membros': [u.para_dict() for u in usuarios]
-        }
+        return RelatorioDepartamento(
+            departamento=departamento,
+            total_usuarios=len(usuarios),
+            usuarios_ativos=total_ativos,
+            usuarios_inativos=len(usuarios) - total_ativos,
+            membros=tuple(u.para_dict() for u in usuarios)
+        )
     
     def relatorio_geral(self) -> Dict[str, Any]:
         """
@@ -368,13 +605,21 @@ class RelatorioEquipe:
         Returns:
             Dicionário com informações gerais
         """
-        todos_usuarios = self.gerenciador_usuarios.listar_usuarios_ativos()
+        versao = self.gerenciador_usuarios.versao
+        if self._cache_geral is None or self._cache_geral[0] != versao:
+            todos_usuarios = self.gerenciador_usuarios.listar_usuarios_ativos()
+            self._cache_geral = (
+                versao,
+                len(todos_usuarios),
+                self._contar_por_departamento(todos_usuarios)
+            )
+        _, total_ativos, departamentos = self._cache_geral
         
         return {
             'timestamp': datetime.now().isoformat(),
             'versao_api': VERSAO_API,
-            'total_usuarios_ativos': len(todos_usuarios),
-            'departamentos': self._contar_por_departamento(todos_usuarios)
+            'total_usuarios_ativos': total_ativos,
+            'departamentos': dict(departamentos)
         }
     
     def _contar_por_departamento(self, usuarios: List[Usuario]) -> Dict[str, int]:
@@ -387,26 +632,60 @@ class RelatorioEquipe:
         Returns:
             Dicionário com contagem por departamento
         """
-        contagem = {}
-        for usuario in usuarios:
-            contagem[usuario.departamento] = contagem.get(usuario.departamento, 0) + 1
-        return contagem
+        return dict(Counter(usuario.departamento for usuario in usuarios))
 
 
 # ============================================================================
 # LOGGER CENTRALIZADO - Para rastrear ações
 # ============================================================================
 
+@dataclass(slots=True)
+class RegistroLog:
+    """
+    Representa uma entrada do log do sistema.
+    
+    Atributos:
+        timestamp_ns: Quando foi registrada (ns desde a época, time.time_ns)
+        nivel: ERRO, AVISO, INFO, DEBUG
+        mensagem: Mensagem descritiva
+        dados: Dados adicionais contextuais
+    
+    O instante é guardado como inteiro e só é formatado quando lido por
+    `timestamp`, já que a maioria dos registros nunca é exibida.
+    """
+    timestamp_ns: int
+    nivel: str
+    mensagem: str
+    dados: Dict[str, Any]
+    
+    @property
+    def timestamp(self) -> str:
+        """Instante do registro em ISO 8601 (horário local)."""
+        segundos, nanos = divmod(self.timestamp_ns, 1_000_000_000)
+        return datetime.fromtimestamp(segundos).replace(
+            microsecond=nanos // 1_000
+        ).isoformat()
+
+
 class LoggerSistema:
     """
     Sistema de logging centralizado.
     
     Importante em trabalho remoto para rastrear ações e debug.
+    
+    Os registros ficam em um buffer circular: ao atingir `capacidade`,
+    os mais antigos são descartados, mantendo a memória limitada em
+    serviços de longa duração.
     """
     
-    def __init__(self):
-        """Inicializa o logger."""
-        self._logs: List[Dict[str, Any]] = []
+    def __init__(self, capacidade: int = MAX_LOGS_MEMORIA):
+        """
+        Inicializa o logger.
+        
+        Args:
+            capacidade: Número máximo de registros mantidos em memória
+        """
+        self._logs: Deque[RegistroLog] = deque(maxlen=capacidade)
     
     def registrar(self, nivel: str, mensagem: str, dados: Dict[str, Any] | None = None) -> None:
         """
@@ -417,29 +696,118 @@ class LoggerSistema:
             mensagem: Mensagem descritiva
             dados: Dados adicionais contextuais
         """
-        log = {
-            'timestamp': datetime.now().isoformat(),
-            'nivel': nivel,
-            'mensagem': mensagem,
-            'dados': dados or {}
-        }
-        self._logs.append(log)
+        self._logs.append(
+            RegistroLog(time.time_ns(), nivel, mensagem, dados or {})
+        )
+    
+    def registrar_muitos(self, entradas: Iterable[Tuple[str, str, Dict[str, Any] | None]]) -> None:
+        """
+        Registra várias ações de uma vez, com o mesmo timestamp.
+        
+        Args:
+            entradas: Tuplas (nivel, mensagem, dados), como em `registrar`
+        """
+        timestamp_ns = time.time_ns()
+        self._logs.extend(
+            RegistroLog(timestamp_ns, nivel, mensagem, dados or {})
+            for nivel, mensagem, dados in entradas
+        )
     
-    def obter_logs_recentes(self, quantidade: int = 10) -> List[Dict[str, Any]]:
-        """Obtém os logs mais recentes."""
-        return self._logs[-quantidade:]
+    def obter_logs_recentes(self, quantidade: int = 10) -> List[RegistroLog]:
+        """Obtém os logs mais recentes, do mais antigo para o mais novo."""
+        if quantidade <= 0:
+            return []
+        recentes = list(islice(reversed(self._logs), quantidade))
+        recentes.reverse()
+        return recentes
+
+
+# ============================================================================
+# DADOS DA DEMONSTRAÇÃO - Constantes criadas uma única vez, ao carregar o módulo
+# ============================================================================
+
+# Linhas usadas nos cabeçalhos de seção da demonstração
+_BARRA: Final[str] = "=" * 70
+_TRACO: Final[str] = "-" * 70
+
+# Marcadores repetidos nas linhas da demonstração
+_CHECK: Final[str] = "✅"
+_BULLET: Final[str] = "  • "
+
+# (id, nome, email, departamento) dos usuários criados pela demonstração
+_SEED_USERS: Final[Tuple[Tuple[str, str, str, str], ...]] = (
+    ("USR001", "João Silva", "joao@empresa.com", "Desenvolvimento"),
+    ("USR002", "Maria Santos", "maria@empresa.com", "Desenvolvimento"),
+    ("USR003", "Carlos Oliveira", "carlos@empresa.com", "Marketing"),
+)
+
+_PRATICAS_GIT: Final[str] = """
+1. COMMITS CLAROS:
+   ✅ git commit -m "feat: adicionar validação de email"
+   ✅ git commit -m "fix: corrigir bug de conexão"
+   ✅ git commit -m "docs: atualizar README com instrções"
+   ❌ git commit -m "ajustes"
+   ❌ git commit -m "corrigido"
+
+2. BRANCHING:
+   ✅ git checkout -b feat/novo-sistema-notificacoes
+   ✅ git checkout -b fix/bug-conexao
+   ✅ git checkout -b docs/api-reference
+   ❌ git checkout -b meu-branch
+   ❌ git checkout -b teste123
+
+3. PULL REQUESTS:
+   ✅ Descrição detalhada do que foi feito
+   ✅ Referência a issues: "Fecha #123"
+   ✅ Screenshots/GIFs quando relevante
+   ✅ Checklist de testes executados
+
+4. REVIEW DE CÓDIGO:
+   ✅ Revisar antes de mergear
+   ✅ Deixar feedback construtivo
+   ✅ Aprovar ou solicitar mudanças
+   ✅ Comunicar-se com respeito
+
+5. DOCUMENTAÇÃO:
+   ✅ README atualizado
+   ✅ Docstrings em código
+   ✅ Exemplos de uso
+   ✅ Guia de desenvolvimento
+
+6. COMUNICAÇÃO:
+   ✅ Usar issues para discussões
+   ✅ Deixar comentários no PR
+   ✅ Usar mention (@usuario) quando necessário
+   ✅ Responder comentários prontamente
+    """
 
 
 # ============================================================================
 # DEMONSTRAÇÃO E TESTES
 # ============================================================================
 
+def _secao(titulo: str) -> str:
+    """Monta o cabeçalho de uma seção, precedido de uma linha em branco."""
+    return f"\n{_BARRA}\n{titulo}\n{_BARRA}"
+
+
+def _subsecao(titulo: str) -> str:
+    """Monta o cabeçalho de uma subseção, precedido de uma linha em branco."""
+    return f"\n{titulo}\n{_TRACO}"
+
+
 def main():
-    """Executa exemplos de trabalho em equipe."""
+    """
+    Executa exemplos de trabalho em equipe.
+    
+    A saída é acumulada em uma lista e escrita no stdout de uma só vez,
+    em vez de uma chamada a print (com lock e flush) por linha.
+    """
+    
+    saida: List[str] = []
+    escrever = saida.append
     
-    print("=" * 70)
-    print("HABILIDADE 5: TRABALHO EM EQUIPE E REMOTO")
-    print("=" * 70)
+    escrever(f"{_BARRA}\nHABILIDADE 5: TRABALHO EM EQUIPE E REMOTO\n{_BARRA}")
     
     # Inicializar serviços
     gerenciador_usuarios = GerenciadorUsuarios()
@@ -447,127 +815,76 @@ def main():
     logger = LoggerSistema()
     
     # 1. CRIAR USUÁRIOS
-    print("\n1. CRIANDO USUÁRIOS")
-    print("-" * 70)
+    escrever(_subsecao("1. CRIANDO USUÁRIOS"))
     usuarios = []
-    nomes = [
-        ("USR001", "João Silva", "joao@empresa.com", "Desenvolvimento"),
-        ("USR002", "Maria Santos", "maria@empresa.com", "Desenvolvimento"),
-        ("USR003", "Carlos Oliveira", "carlos@empresa.com", "Marketing"),
-    ]
     
-    for id_user, nome, email, depto in nomes:
+    for id_user, nome, email, depto in _SEED_USERS:
         usuario = gerenciador_usuarios.criar_usuario(id_user, nome, email, depto)
         usuarios.append(usuario)
-        logger.registrar("INFO", f"Usuário criado", {"id": id_user, "nome": nome})
-        print(f"✅ {nome} ({depto})")
+        escrever(f"{_CHECK} {nome} ({depto})")
+    logger.registrar_muitos(
+        ("INFO", "Usuário criado", {"id": id_user, "nome": nome})
+        for id_user, nome, _, _ in _SEED_USERS
+    )
     
     # 2. ENVIAR MENSAGENS
-    print("\n2. ENVIANDO MENSAGENS")
-    print("-" * 70)
+    escrever(_subsecao("2. ENVIANDO MENSAGENS"))
     msg1 = gerenciador_mensagens.enviar_mensagem(
         usuarios[0],
         "Iniciando novo projeto!",
-        TipoMensagem.INFORMACAO
+        _TIPO_INFO
     )
     msg2 = gerenciador_mensagens.enviar_mensagem(
         usuarios[1],
         "Deploy finalizado com sucesso",
-        TipoMensagem.SUCESSO
+        _TIPO_SUCESSO
     )
-    print(f"✅ Mensagem 1: {msg1.conteudo}")
-    print(f"✅ Mensagem 2: {msg2.conteudo}")
+    escrever(f"{_CHECK} Mensagem 1: {msg1.conteudo}")
+    escrever(f"{_CHECK} Mensagem 2: {msg2.conteudo}")
     
     # 3. MENSAGENS NÃO LIDAS
-    print("\n3. MENSAGENS NÃO LIDAS")
-    print("-" * 70)
-    nao_lidas = gerenciador_mensagens.obter_nao_lidas()
-    print(f"Mensagens não lidas: {len(nao_lidas)}")
-    for msg in nao_lidas:
-        print(f"  • {msg.remetente.nome}: {msg.conteudo}")
+    escrever(_subsecao("3. MENSAGENS NÃO LIDAS"))
+    escrever(f"Mensagens não lidas: {gerenciador_mensagens.contar_nao_lidas()}")
+    for msg in gerenciador_mensagens.obter_nao_lidas():
+        escrever(f"{_BULLET}{msg.remetente.nome}: {msg.conteudo}")
     
     # 4. MARCAR COMO LIDA
-    print("\n4. MARCANDO MENSAGENS COMO LIDAS")
-    print("-" * 70)
+    escrever(_subsecao("4. MARCANDO MENSAGENS COMO LIDAS"))
     gerenciador_mensagens.marcar_lida(msg1.id)
-    print(f"✅ Mensagem {msg1.id} marcada como lida")
+    escrever(f"{_CHECK} Mensagem {msg1.id} marcada como lida")
     
     # 5. RELATÓRIO DO DEPARTAMENTO
-    print("\n5. RELATÓRIO DO DEPARTAMENTO")
-    print("-" * 70)
+    escrever(_subsecao("5. RELATÓRIO DO DEPARTAMENTO"))
     relatorio = RelatorioEquipe(gerenciador_usuarios)
     dados_dev = relatorio.relatorio_departamento("Desenvolvimento")
-    print(f"Departamento: {dados_dev['departamento']}")
-    print(f"Total de usuários: {dados_dev['total_usuarios']}")
-    print(f"Ativos: {dados_dev['usuarios_ativos']}")
-    print(f"Membros: {[u['nome'] for u in dados_dev['membros']]}")
+    escrever(f"Departamento: {dados_dev.departamento}")
+    escrever(f"Total de usuários: {dados_dev.total_usuarios}")
+    escrever(f"Ativos: {dados_dev.usuarios_ativos}")
+    escrever(f"Membros: {', '.join(u['nome'] for u in dados_dev.membros)}")
     
     # 6. RELATÓRIO GERAL
-    print("\n6. RELATÓRIO GERAL")
-    print("-" * 70)
+    escrever(_subsecao("6. RELATÓRIO GERAL"))
     relatorio_geral = relatorio.relatorio_geral()
-    print(f"Total de usuários ativos: {relatorio_geral['total_usuarios_ativos']}")
-    print(f"Departamentos: {relatorio_geral['departamentos']}")
+    escrever(f"Total de usuários ativos: {relatorio_geral['total_usuarios_ativos']}")
+    escrever(f"Departamentos: {relatorio_geral['departamentos']}")
     
     # 7. LOGS DO SISTEMA
-    print("\n7. LOGS DO SISTEMA (últimos 3)")
-    print("-" * 70)
+    escrever(_subsecao("7. LOGS DO SISTEMA (últimos 3)"))
     logs = logger.obter_logs_recentes(3)
-    for log in logs:
-        print(f"[{log['nivel']}] {log['mensagem']}")
+    if logs:
+        escrever("\n".join(f"[{log.nivel}] {log.mensagem}" for log in logs))
     
-    print("\n" + "=" * 70)
-    print("✅ Trabalho em equipe demonstrado com sucesso!")
-    print("=" * 70)
+    escrever(_secao(f"{_CHECK} Trabalho em equipe demonstrado com sucesso!"))
     
     # ========================================================================
     # BOAS PRÁTICAS DE GIT PARA TRABALHO REMOTO
     # ========================================================================
     
-    print("\n" + "=" * 70)
-    print("📋 BOAS PRÁTICAS DE GIT PARA TRABALHO REMOTO")
-    print("=" * 70)
+    escrever(_secao("📋 BOAS PRÁTICAS DE GIT PARA TRABALHO REMOTO"))
     
-    praticas = """
-1. COMMITS CLAROS:
-   ✅ git commit -m "feat: adicionar validação de email"
-   ✅ git commit -m "fix: corrigir bug de conexão"
-   ✅ git commit -m "docs: atualizar README com instrções"
-   ❌ git commit -m "ajustes"
-   ❌ git commit -m "corrigido"
-
-2. BRANCHING:
-   ✅ git checkout -b feat/novo-sistema-notificacoes
-   ✅ git checkout -b fix/bug-conexao
-   ✅ git checkout -b docs/api-reference
-   ❌ git checkout -b meu-branch
-   ❌ git checkout -b teste123
-
-3. PULL REQUESTS:
-   ✅ Descrição detalhada do que foi feito
-   ✅ Referência a issues: "Fecha #123"
-   ✅ Screenshots/GIFs quando relevante
-   ✅ Checklist de testes executados
-
-4. REVIEW DE CÓDIGO:
-   ✅ Revisar antes de mergear
-   ✅ Deixar feedback construtivo
-   ✅ Aprovar ou solicitar mudanças
-   ✅ Comunicar-se com respeito
-
-5. DOCUMENTAÇÃO:
-   ✅ README atualizado
-   ✅ Docstrings em código
-   ✅ Exemplos de uso
-   ✅ Guia de desenvolvimento
-
-6. COMUNICAÇÃO:
-   ✅ Usar issues para discussões
-   ✅ Deixar comentários no PR
-   ✅ Usar mention (@usuario) quando necessário
-   ✅ Responder comentários prontamente
-    """
-    print(praticas)
+    escrever(_PRATICAS_GIT)
+    
+    sys.stdout.write("\n".join(saida) + "\n")
 
 
 if __name__ == "__main__":